@@ -3,13 +3,109 @@ This file handles communication with Binance.
 Think of it as a messenger who delivers your orders to the exchange.
 """
 
-from binance.client import Client
-from binance.exceptions import BinanceAPIException
+from binance.client import BaseClient, Client, AsyncClient
+from binance.exceptions import BinanceAPIException, BinanceRequestException
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+import asyncio
+import hashlib
+import hmac
 import logging
+import threading
+import time
+
+# orjson reads Binance's replies much faster than the built-in json module.
+# Fall back to json if it isn't installed.
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
 
 # Get our program's diary
 logger = logging.getLogger('trading_bot.client')
 
+# The clients shared by every order placed from this program,
+# one per (api_key, api_secret, testnet)
+_shared_clients = {}
+
+# How long to trust the downloaded trading rules (step/tick sizes) before
+# asking Binance again. They change rarely, so a couple of hours is plenty.
+EXCHANGE_INFO_TTL = 2 * 60 * 60  # seconds
+
+class OrderError(Exception):
+    """
+    Raised when Binance doesn't accept an order.
+    
+    `code` is Binance's error code (e.g. -2019 for "Margin is insufficient"),
+    or None if the order failed for another reason (e.g. no internet).
+    """
+    
+    def __init__(self, message: str, code: int = None):
+        self.code = code
+        super().__init__(message)
+
+def _to_text(value):
+    """
+    Write a Decimal as plain digits (e.g. 10, not 1E+1) for Binance.
+    Other values are passed through unchanged.
+    """
+    if isinstance(value, Decimal):
+        return format(value, 'f')
+    return value
+
+class _CachedSignatureMixin:
+    """
+    Signs requests without redoing the HMAC key set-up every time.
+    
+    python-binance builds a fresh HMAC from the secret for every signed
+    request. We build it once and copy it per request instead, which
+    gives exactly the same signature for less work.
+    """
+    _hmac_template = None
+    
+    def _hmac_signature(self, query_string: str) -> str:
+        assert self.API_SECRET, "API Secret required for private endpoints"
+        
+        if self._hmac_template is None:
+            self._hmac_template = hmac.new(self.API_SECRET.encode('utf-8'), None, hashlib.sha256)
+        
+        signature = self._hmac_template.copy()
+        signature.update(query_string.encode('utf-8'))
+        return signature.hexdigest()
+
+class _Client(_CachedSignatureMixin, Client):
+    """python-binance Client with cached request signing and faster JSON."""
+    
+    def __init__(self, api_key: str, api_secret: str, testnet: bool = False):
+        # Skip Client.__init__, which pings the spot server. That request
+        # doesn't help the futures connection we use.
+        BaseClient.__init__(self, api_key, api_secret, testnet=testnet)
+    
+    @staticmethod
+    def _handle_response(response):
+        # Same as python-binance's version, but decodes with _json_loads
+        if not (200 <= response.status_code < 300):
+            raise BinanceAPIException(response, response.status_code, response.text)
+        try:
+            return _json_loads(response.content)
+        except ValueError:
+            raise BinanceRequestException('Invalid Response: %s' % response.text)
+
+class _AsyncClient(_CachedSignatureMixin, AsyncClient):
+    """python-binance AsyncClient with cached request signing and faster JSON."""
+    
+    async def _handle_response(self, response):
+        # Same as python-binance's version, but decodes with _json_loads
+        if not str(response.status).startswith('2'):
+            raise BinanceAPIException(response, response.status, await response.text())
+        body = await response.read()
+        try:
+            return _json_loads(body)
+        except ValueError:
+            raise BinanceRequestException('Invalid Response: %s' % body.decode('utf-8', 'replace'))
+
 class BinanceFuturesClient:
     """
     A client to communicate with Binance Futures Testnet.
@@ -18,7 +114,10 @@ class BinanceFuturesClient:
     
     def __init__(self, api_key: str, api_secret: str, testnet: bool = True):
         """
-        Initialize the connection to Binance.
+        Get ready to talk to Binance.
+        
+        Nothing is sent yet: the sync connection is opened the first time
+        `client` is used, the async one by connect_async().
         
         Parameters:
         - api_key: Your Binance API key (like username)
@@ -27,20 +126,76 @@ class BinanceFuturesClient:
         """
         logger.info("Starting Binance Futures client...")
         
+        # Remember credentials so the connections can be opened later
+        self._api_key = api_key
+        self._api_secret = api_secret
+        self._testnet = testnet
+        self._client = None
+        self._client_lock = threading.Lock()
+        self.async_client = None
+        self._keep_alive_task = None
+        
+        # Trading rules per symbol, filled in by get_symbol_filters
+        self._symbol_filters = None
+        self._symbol_filters_expire = 0
+    
+    @property
+    def client(self):
+        """
+        The sync python-binance client, created the first time it is needed.
+        
+        The async path (connect_async) never needs it, so it doesn't pay
+        for a second connection.
+        """
+        if self._client is None:
+            # Batch threads may all get here at once; only one creates it
+            with self._client_lock:
+                if self._client is None:
+                    self._client = self._create_client()
+        
+        return self._client
+    
+    def _create_client(self):
+        """Create the sync python-binance client with our credentials."""
         try:
-            # Create Binance client with our credentials
-            self.client = Client(
-                api_key=api_key,
-                api_secret=api_secret,
-                testnet=testnet  # Always True for practice mode
+            client = _Client(
+                api_key=self._api_key,
+                api_secret=self._api_secret,
+                testnet=self._testnet  # Always True for practice mode
             )
-            logger.info(" Binance client connected successfully!")
+            self._setup_session(client.session)
+            # Nothing has been sent yet - the first request connects
+            logger.info(" Binance client ready")
             
         except Exception as e:
-            logger.error(f" Failed to connect to Binance: {str(e)}")
+            logger.error(" Failed to create Binance client: %s", e)
             raise
+        
+        return client
     
-    def place_market_order(self, symbol: str, side: str, quantity: float):
+    @staticmethod
+    def _setup_session(session):
+        """
+        Keep the connection to Binance open between requests.
+        
+        Opening a secure (TLS) connection takes several round-trips, so we
+        reuse it for every order instead of reconnecting each time.
+        """
+        session.headers.update({
+            'Connection': 'keep-alive',
+            'Keep-Alive': 'timeout=180, max=1000'
+        })
+        
+        # Retry only on temporary server errors. urllib3 never retries POST by
+        # default, so an order is never sent twice.
+        retries = Retry(total=3, backoff_factor=0.2, status_forcelist=[502, 503, 504])
+        session.mount('https://', HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=retries
+        ))
+    
+    def place_market_order(self, symbol: str, side: str, quantity: Decimal):
         """
         Place a MARKET order (buys/sells immediately at current price).
         
@@ -50,34 +205,12 @@ class BinanceFuturesClient:
         - symbol: Trading pair like "BTCUSDT"
         - side: "BUY" or "SELL"
         - quantity: How much to buy/sell
+        
+        Raises OrderError if the order fails.
         """
-        try:
-            logger.info(f" Placing MARKET order: {side} {quantity} {symbol}")
-            
-            # Send order to Binance
-            order = self.client.futures_create_order(
-                symbol=symbol,
-                side=side.upper(),  # Convert to uppercase
-                type='MARKET',      # Market order type
-                quantity=quantity   # How much to trade
-            )
-            
-            logger.info(f" Market order placed! Order ID: {order.get('orderId')}")
-            return order
-            
-        except BinanceAPIException as e:
-            # Handle Binance-specific errors
-            error_msg = f"Binance API Error: {e.message} (Error code: {e.code})"
-            logger.error(error_msg)
-            raise Exception(error_msg)
-            
-        except Exception as e:
-            # Handle any other errors
-            error_msg = f"Unexpected error placing market order: {str(e)}"
-            logger.error(error_msg)
-            raise Exception(error_msg)
+        return self._create_order(self.build_order(symbol, side, 'MARKET', quantity))
     
-    def place_limit_order(self, symbol: str, side: str, quantity: float, price: float):
+    def place_limit_order(self, symbol: str, side: str, quantity: Decimal, price: Decimal):
         """
         Place a LIMIT order (sets specific price to buy/sell).
         
@@ -88,45 +221,303 @@ class BinanceFuturesClient:
         - side: "BUY" or "SELL"
         - quantity: How much to trade
         - price: At what price to execute
+        
+        Raises OrderError if the order fails.
+        """
+        return self._create_order(self.build_order(symbol, side, 'LIMIT', quantity, price))
+    
+    def get_order_status(self, symbol: str, order_id: int):
+        """
+        Check the status of an order.
+        
+        Useful to see if order was filled, cancelled, or still waiting.
         """
         try:
-            logger.info(f" Placing LIMIT order: {side} {quantity} {symbol} @ ${price}")
+            logger.info(" Checking order status for ID: %s", order_id)
+            order_status = self.client.futures_get_order(symbol=symbol, orderId=order_id)
+            logger.info("Order status: %s", order_status.get('status'))
+            return order_status
             
-            # Send order to Binance
-            order = self.client.futures_create_order(
-                symbol=symbol,
-                side=side.upper(),
-                type='LIMIT',
-                quantity=quantity,
-                price=price,
-                timeInForce='GTC'  # Good Till Cancelled (order stays until filled or cancelled)
+        except Exception as e:
+            logger.error("Failed to check order status: %s", e)
+            return None
+
+    
+    @staticmethod
+    def build_order(symbol: str, side: str, order_type: str, quantity: Decimal, price: Decimal = None) -> dict:
+        """
+        Turn the details of one order into the parameters Binance expects.
+        
+        Example: build_order("BTCUSDT", "BUY", "MARKET", 0.001)
+        """
+        order = {
+            'symbol': symbol,
+            'side': side.upper(),
+            'type': order_type,
+            'quantity': _to_text(quantity)
+        }
+        
+        if order_type == 'LIMIT':
+            order['price'] = _to_text(price)
+            order['timeInForce'] = 'GTC'  # Good Till Cancelled
+        
+        return order
+    
+    def get_symbol_filters(self, symbol: str) -> dict:
+        """
+        Get Binance's trading rules for a symbol.
+        
+        Returns a dict with Decimal values:
+        - stepSize: quantity must be a multiple of this
+        - minQty: smallest allowed quantity
+        - tickSize: price must be a multiple of this
+        - minNotional: smallest allowed order value (quantity x price)
+        
+        The rules for all symbols are downloaded in one request and
+        reused for EXCHANGE_INFO_TTL seconds.
+        Raises ValueError if Binance doesn't know the symbol.
+        """
+        self.load_symbol_filters()
+        
+        try:
+            return self._symbol_filters[symbol]
+        except KeyError:
+            raise ValueError(f"Unknown symbol: {symbol}. Binance Futures doesn't trade it")
+    
+    def load_symbol_filters(self):
+        """
+        Download the trading rules (if they are missing or too old),
+        so get_symbol_filters can answer without touching the network.
+        """
+        if self._symbol_filters_stale():
+            logger.info("Downloading trading rules from Binance...")
+            self._store_symbol_filters(self.client.futures_exchange_info())
+    
+    async def load_symbol_filters_async(self):
+        """
+        Download the trading rules through the async connection
+        (if they are missing or too old), so get_symbol_filters can
+        answer without touching the network. Call connect_async() first.
+        """
+        if self._symbol_filters_stale():
+            logger.info("Downloading trading rules from Binance...")
+            self._store_symbol_filters(await self.async_client.futures_exchange_info())
+    
+    def _symbol_filters_stale(self) -> bool:
+        """True if the trading rules need to be (re)downloaded."""
+        return self._symbol_filters is None or time.monotonic() >= self._symbol_filters_expire
+    
+    def _store_symbol_filters(self, exchange_info: dict):
+        """Keep the rules for every symbol in exchangeInfo for EXCHANGE_INFO_TTL seconds."""
+        self._symbol_filters = {
+            info['symbol']: self._parse_filters(info['filters'])
+            for info in exchange_info['symbols']
+        }
+        self._symbol_filters_expire = time.monotonic() + EXCHANGE_INFO_TTL
+    
+    @staticmethod
+    def _parse_filters(filters: list) -> dict:
+        """Pick the rules we need out of a symbol's exchangeInfo filters."""
+        by_type = {f['filterType']: f for f in filters}
+        lot_size = by_type.get('LOT_SIZE', {})
+        price_filter = by_type.get('PRICE_FILTER', {})
+        min_notional = by_type.get('MIN_NOTIONAL', {})
+        
+        return {
+            'stepSize': Decimal(lot_size.get('stepSize', '0')),
+            'minQty': Decimal(lot_size.get('minQty', '0')),
+            'tickSize': Decimal(price_filter.get('tickSize', '0')),
+            # Futures call it "notional", spot calls it "minNotional"
+            'minNotional': Decimal(min_notional.get('notional', min_notional.get('minNotional', '0')))
+        }
+    
+    @staticmethod
+    def _log_placing(order: dict):
+        """Write "Placing ... order" to the log for an order made by build_order."""
+        if 'price' in order:
+            logger.info(" Placing %s order: %s %s %s @ $%s", order['type'], order['side'],
+                        order['quantity'], order['symbol'], order['price'])
+        else:
+            logger.info(" Placing %s order: %s %s %s", order['type'], order['side'],
+                        order['quantity'], order['symbol'])
+    
+    @staticmethod
+    def _order_error(error: Exception, order_type: str) -> OrderError:
+        """Log why an order failed and turn the error into an OrderError."""
+        if isinstance(error, BinanceAPIException):
+            # Handle Binance-specific errors
+            error_msg = f"Binance API Error: {error.message} (Error code: {error.code})"
+            code = error.code
+        else:
+            # Handle any other errors
+            error_msg = f"Unexpected error placing {order_type.lower()} order: {str(error)}"
+            code = None
+        
+        logger.error(error_msg)
+        return OrderError(error_msg, code=code)
+    
+    def _create_order(self, order: dict):
+        """
+        Send one order (made by build_order) through the shared HTTP session.
+        """
+        order_type = order['type']
+        
+        try:
+            self._log_placing(order)
+            
+            response = self.client.futures_create_order(**order)
+            
+            logger.info(" %s order placed! Order ID: %s", order_type.capitalize(), response.get('orderId'))
+            return response
+            
+        except Exception as e:
+            raise self._order_error(e, order_type) from e
+    
+    def place_orders_batch(self, orders: list, max_workers: int = 8):
+        """
+        Place many orders at the same time without asyncio.
+        
+        Up to `max_workers` orders are sent in parallel over the
+        same keep-alive connection pool.
+        
+        Parameters:
+        - orders: List of orders made by build_order
+        
+        Returns one result per order, in the same order as given.
+        A failed order gives back its OrderError instead of a response.
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(self._create_order, order) for order in orders]
+        
+        results = []
+        for future in futures:
+            error = future.exception()
+            results.append(error if error is not None else future.result())
+        
+        return results
+    
+    async def connect_async(self):
+        """
+        Open the async connection to Binance (only the first time).
+        
+        The async client lets many orders and status checks run
+        at the same time over one open connection, which is kept open
+        until close_async().
+        """
+        if self.async_client is None:
+            logger.info("Opening async connection to Binance...")
+            # Not AsyncClient.create(): that pings the spot server and asks
+            # for its time, two requests to a host we never trade on.
+            # The sync client doesn't do that either.
+            self.async_client = _AsyncClient(
+                api_key=self._api_key,
+                api_secret=self._api_secret,
+                testnet=self._testnet
             )
             
-            logger.info(f" Limit order placed! Order ID: {order.get('orderId')}")
-            return order
+            # Keep the connection warm while it is open
+            self._keep_alive_task = asyncio.create_task(self.keep_alive_async())
+        
+        return self.async_client
+    
+    async def close_async(self):
+        """Close the async connection to Binance."""
+        if self._keep_alive_task is not None:
+            self._keep_alive_task.cancel()
+            self._keep_alive_task = None
+        
+        if self.async_client is not None:
+            await self.async_client.close_connection()
+            self.async_client = None
+    
+    async def keep_alive_async(self, interval: int = 60):
+        """
+        Ping Binance every `interval` seconds so the connection stays open.
+        
+        connect_async() runs this in the background automatically.
+        """
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.async_client.futures_ping()
+            except Exception as e:
+                logger.warning("Keep-alive ping failed: %s", e)
+    
+    async def _create_order_async(self, order: dict):
+        """
+        Send one order (made by build_order) through the async connection.
+        """
+        order_type = order['type']
+        
+        try:
+            self._log_placing(order)
+            
+            response = await self.async_client.futures_create_order(**order)
             
-        except BinanceAPIException as e:
-            error_msg = f"Binance API Error: {e.message} (Error code: {e.code})"
-            logger.error(error_msg)
-            raise Exception(error_msg)
+            logger.info(" %s order placed! Order ID: %s", order_type.capitalize(), response.get('orderId'))
+            return response
             
         except Exception as e:
-            error_msg = f"Unexpected error placing limit order: {str(e)}"
-            logger.error(error_msg)
-            raise Exception(error_msg)
+            raise self._order_error(e, order_type) from e
     
-    def get_order_status(self, symbol: str, order_id: int):
+    async def place_market_order_async(self, symbol: str, side: str, quantity: Decimal):
         """
-        Check the status of an order.
+        Same as place_market_order, but can run alongside other orders.
+        Call connect_async() first.
+        """
+        return await self._create_order_async(
+            self.build_order(symbol, side, 'MARKET', quantity)
+        )
+    
+    async def place_limit_order_async(self, symbol: str, side: str, quantity: Decimal, price: Decimal):
+        """
+        Same as place_limit_order, but can run alongside other orders.
+        Call connect_async() first.
+        """
+        return await self._create_order_async(
+            self.build_order(symbol, side, 'LIMIT', quantity, price)
+        )
+    
+    async def place_orders_async(self, orders: list):
+        """
+        Place many orders at the same time.
         
-        Useful to see if order was filled, cancelled, or still waiting.
+        Parameters:
+        - orders: List of orders made by build_order
+        
+        Returns one result per order, in the same order as given.
+        A failed order gives back its OrderError instead of a response.
+        """
+        return await asyncio.gather(
+            *[self._create_order_async(order) for order in orders],
+            return_exceptions=True
+        )
+    
+    async def get_order_status_async(self, symbol: str, order_id: int):
+        """
+        Same as get_order_status, but can run alongside other requests.
         """
         try:
-            logger.info(f" Checking order status for ID: {order_id}")
-            order_status = self.client.futures_get_order(symbol=symbol, orderId=order_id)
-            logger.info(f"Order status: {order_status.get('status')}")
+            logger.info(" Checking order status for ID: %s", order_id)
+            order_status = await self.async_client.futures_get_order(symbol=symbol, orderId=order_id)
+            logger.info("Order status: %s", order_status.get('status'))
             return order_status
             
         except Exception as e:
-            logger.error(f"Failed to check order status: {str(e)}")
-            return None
\ No newline at end of file
+            logger.error("Failed to check order status: %s", e)
+            return None
+
+def get_client(api_key: str, api_secret: str, testnet: bool = True) -> BinanceFuturesClient:
+    """
+    Get the shared Binance client for these credentials, creating it the first time.
+    
+    Every order placed with the same credentials reuses this client,
+    so they all share one open connection to Binance. Other credentials
+    (or testnet=False) get a client of their own.
+    """
+    key = (api_key, api_secret, testnet)
+    
+    if key not in _shared_clients:
+        _shared_clients[key] = BinanceFuturesClient(api_key, api_secret, testnet)
+    
+    return _shared_clients[key]
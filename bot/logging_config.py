@@ -3,9 +3,11 @@ This file sets up logging - like a diary for our program.
 It records what happens so we can check if something goes wrong.
 """
 
+import atexit
 import logging
+import logging.handlers
+import re
 import sys
-from datetime import datetime
 
 def setup_logging():
     """
@@ -14,13 +16,44 @@ def setup_logging():
     """
     # Create a diary/logger named 'trading_bot'
     logger = logging.getLogger('trading_bot')
+    
+    # Already set up (e.g. imported again)? Adding the handlers twice
+    # would write every message twice.
+    if logger.handlers:
+        return logger
+    
     logger.setLevel(logging.DEBUG)  # Record everything
     
-    # Create a file to write logs to (with today's date)
-    log_filename = f'trading_bot_{datetime.now().strftime("%Y%m%d")}.log'
-    file_handler = logging.FileHandler(log_filename)
+    # Create a file to write logs to. At midnight it is renamed with the
+    # day's date (e.g. trading_bot.log.20240101) and a new one is started,
+    # so a bot left running for days still gets one file per day.
+    # delay=True: the file is only opened when the first message is written
+    log_filename = 'trading_bot.log'
+    file_handler = logging.handlers.TimedRotatingFileHandler(
+        log_filename,
+        when='midnight',
+        backupCount=14,  # Keep two weeks of old logs
+        encoding='utf-8',
+        delay=True
+    )
+    file_handler.suffix = '%Y%m%d'
+    # Must match the suffix, or old logs would never be cleaned up
+    file_handler.extMatch = re.compile(r'^\d{8}(\.\w+)?$', re.ASCII)
     file_handler.setLevel(logging.DEBUG)  # Write all details to file
     
+    # Collect file messages in memory and write them in one go, instead of
+    # one disk write per message. Errors are written out straight away.
+    buffered_handler = logging.handlers.MemoryHandler(
+        1024,
+        flushLevel=logging.ERROR,
+        target=file_handler,
+        flushOnClose=True
+    )
+    buffered_handler.setLevel(logging.DEBUG)
+    
+    # Make sure nothing is left in memory when the program exits
+    atexit.register(buffered_handler.flush)
+    
     # Create a screen display for logs
     screen_handler = logging.StreamHandler(sys.stdout)
     screen_handler.setLevel(logging.INFO)  # Only show important messages on screen
@@ -36,8 +69,8 @@ def setup_logging():
     screen_handler.setFormatter(log_format)
     
     # Connect the handlers to our logger
-    logger.addHandler(file_handler)
+    logger.addHandler(buffered_handler)
     logger.addHandler(screen_handler)
     
-    logger.info(f"Logging system started. Writing logs to: {log_filename}")
+    logger.info("Logging system started. Writing logs to: %s", log_filename)
     return logger
\ No newline at end of file
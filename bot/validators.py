@@ -4,6 +4,13 @@ Think of it as a security guard checking IDs at the door.
 """
 
 import re
+from decimal import Decimal, InvalidOperation
+
+# Built once when the program starts, instead of on every check
+_SYMBOL_RE = re.compile(r'^[A-Z0-9]{5,12}\Z')  # Only used to double-check the fast test below
+_SIDES = frozenset(('BUY', 'SELL'))
+_TYPES = frozenset(('MARKET', 'LIMIT'))
+_MIN_QUANTITY_HINT = Decimal('0.001')
 
 class Validator:
     """
@@ -23,10 +30,28 @@ class Validator:
         """
         symbol = symbol.upper().strip()  # Convert to uppercase and remove spaces
         
-        # Define pattern: only letters and numbers, 5-12 characters
-        pattern = r'^[A-Z0-9]{5,12}$'
+        return Validator.validate_symbol_fast(symbol)
+    
+    @staticmethod
+    def validate_symbol_fast(symbol: str) -> str:
+        """
+        Same as validate_symbol, but for a symbol that is already
+        uppercase with no spaces around it (e.g. from a batch file
+        that was cleaned up earlier).
+        """
+        # Same rule as the pattern ^[A-Z0-9]{5,12}$, but the str methods
+        # run in C and are much quicker than the regex engine
+        valid = (
+            5 <= len(symbol) <= 12
+            and symbol.isascii()  # isalnum() alone would also allow letters like "É"
+            and symbol.isalnum()
+            and (symbol.isupper() or symbol.isdigit())  # No lowercase letters
+        )
         
-        if not re.match(pattern, symbol):
+        if __debug__:
+            assert valid == bool(_SYMBOL_RE.match(symbol)), symbol
+        
+        if not valid:
             raise ValueError(f"Invalid symbol: {symbol}. Must be like 'BTCUSDT', 'ETHUSDT'")
         
         return symbol
@@ -38,7 +63,15 @@ class Validator:
         """
         side = side.upper().strip()
         
-        if side not in ['BUY', 'SELL']:
+        return Validator.validate_side_fast(side)
+    
+    @staticmethod
+    def validate_side_fast(side: str) -> str:
+        """
+        Same as validate_side, but for a side that is already
+        uppercase with no spaces around it.
+        """
+        if side not in _SIDES:
             raise ValueError(f"Invalid side: {side}. Must be 'BUY' or 'SELL'")
         
         return side
@@ -50,49 +83,99 @@ class Validator:
         """
         order_type = order_type.upper().strip()
         
-        if order_type not in ['MARKET', 'LIMIT']:
+        return Validator.validate_order_type_fast(order_type)
+    
+    @staticmethod
+    def validate_order_type_fast(order_type: str) -> str:
+        """
+        Same as validate_order_type, but for an order type that is already
+        uppercase with no spaces around it.
+        """
+        if order_type not in _TYPES:
             raise ValueError(f"Invalid order type: {order_type}. Must be 'MARKET' or 'LIMIT'")
         
         return order_type
     
     @staticmethod
-    def validate_quantity(quantity: str) -> float:
+    def validate_quantity(quantity: str, step: Decimal = None) -> Decimal:
         """
         Check if quantity is a valid positive number.
         
+        If `step` (the symbol's stepSize from Binance) is given, the quantity
+        is rounded down to a multiple of it, so Binance won't reject it for
+        having too many decimals.
+        
         Example valid: "0.001", "1", "10.5"
         Example invalid: "0", "-1", "abc"
         """
         try:
-            # Try to convert to float
-            qty = float(quantity)
+            # Try to convert to an exact decimal number (floats can't hold 0.001 exactly)
+            qty = Decimal(quantity)
             
-            # Check if positive
-            if qty <= 0:
+            # Check if positive (and a real number, not "nan" or "inf")
+            if not qty.is_finite() or qty <= 0:
                 raise ValueError("Quantity must be greater than 0")
             
-            # Check if too small (Binance minimum is usually 0.001 for BTC)
-            if qty < 0.001:
-                print(f"Warning: Quantity {qty} might be too small for some symbols")
-            
-            return qty
-            
-        except ValueError:
+        except (ValueError, TypeError, InvalidOperation):
             # If conversion fails or value is invalid
             raise ValueError(f"Invalid quantity: {quantity}. Must be a positive number")
+        
+        if step:
+            qty = (qty // step) * step
+            if qty <= 0:
+                raise ValueError(f"Invalid quantity: {quantity}. Must be at least {step}")
+        
+        # Check if too small (Binance minimum is usually 0.001 for BTC)
+        elif qty < _MIN_QUANTITY_HINT:
+            print(f"Warning: Quantity {qty} might be too small for some symbols")
+        
+        return qty
     
     @staticmethod
-    def validate_price(price: str) -> float:
+    def validate_price(price: str, tick: Decimal = None, side: str = None) -> Decimal:
         """
         Check if price is a valid positive number.
+        
+        If `tick` (the symbol's tickSize from Binance) is given, a price that
+        isn't a multiple of it is rounded in the trader's favour: down for a
+        BUY (never pay more), up for a SELL (never sell for less). Without a
+        side it is refused, and the error names the two nearest valid prices.
         """
         try:
-            p = float(price)
+            p = Decimal(price)
             
-            if p <= 0:
+            if not p.is_finite() or p <= 0:
                 raise ValueError("Price must be greater than 0")
             
-            return p
+        except (ValueError, TypeError, InvalidOperation):
+            raise ValueError(f"Invalid price: {price}. Must be a positive number")
+        
+        if tick and p % tick:
+            lower = (p // tick) * tick
+            upper = lower + tick
+            
+            if side == 'BUY':
+                p = lower
+            elif side == 'SELL':
+                p = upper
+            else:
+                raise ValueError(
+                    f"Invalid price: {price}. Must be a multiple of {tick}, e.g. {lower} or {upper}"
+                )
             
-        except ValueError:
-            raise ValueError(f"Invalid price: {price}. Must be a positive number")
\ No newline at end of file
+            if p <= 0:
+                raise ValueError(f"Invalid price: {price}. Must be at least {tick}")
+        
+        return p
+    
+    @staticmethod
+    def validate_notional(quantity: Decimal, price: Decimal, min_notional: Decimal) -> None:
+        """
+        Check that an order is big enough (quantity x price) for Binance.
+        
+        Example: with a minimum of 5 USDT, 0.001 BTC @ 2000 (= 2 USDT) is too small.
+        """
+        if min_notional and quantity * price < min_notional:
+            raise ValueError(
+                f"Order value {quantity * price} is below the minimum of {min_notional}"
+            )
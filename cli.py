@@ -6,21 +6,21 @@ Think of it as the control panel for our trading bot.
 """
 
 import argparse
+import functools
+import json
+import operator
 import os
 import sys
-from dotenv import load_dotenv
 
 # Import our custom modules
-from bot.client import BinanceFuturesClient
+# (asyncio, bot.client and dotenv are imported only once they are needed,
+#  because they are slow to load and --help or a typo doesn't need them)
 from bot.validators import Validator
 from bot.logging_config import setup_logging
 
 # Import logging
 import logging
 
-# Load environment variables from .env file
-load_dotenv()
-
 # Setup logging (our program's diary)
 logger = setup_logging()
 
@@ -31,8 +31,28 @@ def print_banner():
     print("                 (TESTNET MODE)")
     print("="*60)
 
-def print_order_summary(symbol, side, order_type, quantity, price=None):
-    """Print a summary of the order before placing it"""
+def ask_confirmation(question, assume_yes=False):
+    """
+    Ask the user a yes/no question. Returns True only for "yes".
+    
+    Doesn't ask (and returns True) when assume_yes is set (--yes) or when
+    no one is at a terminal to answer, e.g. when run from a script.
+    """
+    if assume_yes or not sys.stdin.isatty():
+        return True
+    
+    try:
+        answer = input(f"\n  {question} (yes/no): ").lower()
+    except EOFError:
+        # Input was closed (Ctrl+D), so don't place anything
+        return False
+    return answer == 'yes'
+
+def print_order_summary(symbol, side, order_type, quantity, price=None, assume_yes=False):
+    """
+    Print a summary of the order before placing it,
+    then ask the user to confirm it.
+    """
     print("\n ORDER SUMMARY:")
     print("-" * 40)
     print(f"   Symbol:       {symbol}")
@@ -43,34 +63,143 @@ def print_order_summary(symbol, side, order_type, quantity, price=None):
         print(f"   Price:        ${price}")
     print("-" * 40)
     
-    # Ask for confirmation
-    confirm = input("\n  Confirm this order? (yes/no): ").lower()
-    return confirm == 'yes'
+    return ask_confirmation("Confirm this order?", assume_yes)
+
+def print_batch_summary(orders, assume_yes=False):
+    """
+    Print all orders of a batch as one table,
+    then ask the user to confirm them all at once.
+    """
+    print(f"\n BATCH SUMMARY ({len(orders)} orders):")
+    print("-" * 60)
+    print(f"   {'#':<4}{'Symbol':<14}{'Side':<6}{'Type':<8}{'Quantity':<14}Price")
+    for number, (symbol, side, order_type, quantity, price) in enumerate(orders, start=1):
+        shown_price = f"${price}" if price else "-"
+        print(f"   {number:<4}{symbol:<14}{side:<6}{order_type:<8}{str(quantity):<14}{shown_price}")
+    print("-" * 60)
+    
+    return ask_confirmation(f"Confirm all {len(orders)} orders?", assume_yes)
+
+# Fields Binance always sends back for a placed order, read in one step
+_get_result = operator.itemgetter('orderId', 'status')
 
 def print_order_result(order_response):
     """Print the result of the placed order"""
-    print("\n ORDER PLACED SUCCESSFULLY!")
-    print("="*50)
-    print(f"   Order ID:     {order_response.get('orderId')}")
-    print(f"   Status:       {order_response.get('status')}")
-    print(f"   Executed Qty: {order_response.get('executedQty', '0')}")
-    print(f"   Avg Price:    ${order_response.get('avgPrice', 'N/A')}")
-    print("="*50)
+    order_id, status = _get_result(order_response)
+    order_type = order_response.get('type')
+    executed_qty = order_response.get('executedQty', '0')
+    avg_price = order_response.get('avgPrice', 'N/A')
     
     # Give some advice based on order type
-    if order_response.get('type') == 'LIMIT':
-        print("\n Your limit order is now active!")
-        print("   It will execute when the market reaches your price.")
+    if order_type == 'LIMIT':
+        advice = (" Your limit order is now active!\n"
+                  "   It will execute when the market reaches your price.")
     else:
-        print("\n Market order executed immediately!")
+        advice = " Market order executed immediately!"
+    
+    line = "=" * 50
+    print(
+        f"\n ORDER PLACED SUCCESSFULLY!\n"
+        f"{line}\n"
+        f"   Order ID:     {order_id}\n"
+        f"   Status:       {status}\n"
+        f"   Executed Qty: {executed_qty}\n"
+        f"   Avg Price:    ${avg_price}\n"
+        f"{line}\n"
+        f"\n{advice}"
+    )
 
-def main():
+@functools.lru_cache(maxsize=1)
+def _get_credentials():
     """
-    Main function - the starting point of our program.
-    This handles command line arguments and orchestrates everything.
+    Read the API key and secret (from the environment or the .env file).
+    
+    The answer is remembered, so asking again later is free.
+    Raises RuntimeError if either one is missing.
     """
-    print_banner()
+    # Load environment variables from .env file, unless they are already
+    # set (e.g. exported in the shell) - then there is no file to read
+    if 'BINANCE_API_KEY' not in os.environ or 'BINANCE_API_SECRET' not in os.environ:
+        from dotenv import load_dotenv
+        load_dotenv()
+    
+    api_key = os.getenv('BINANCE_API_KEY')
+    api_secret = os.getenv('BINANCE_API_SECRET')
     
+    if not api_key or not api_secret:
+        raise RuntimeError("API credentials not found")
+    
+    return api_key, api_secret
+
+def validate_order(symbol, side, order_type, quantity, price=None):
+    """
+    Check every part of one order using our Validator class.
+    Returns the cleaned-up values, or raises ValueError if something is wrong.
+    """
+    # Clean up the text once here, so the validators don't each redo it
+    symbol = Validator.validate_symbol_fast(symbol.strip().upper())
+    side = Validator.validate_side_fast(side.strip().upper())
+    order_type = Validator.validate_order_type_fast(order_type.strip().upper())
+    quantity = Validator.validate_quantity(quantity)
+    
+    # Special check for LIMIT orders
+    if order_type == 'LIMIT':
+        if price is None:
+            raise ValueError(" Price is required for LIMIT orders!")
+        price = Validator.validate_price(price)
+    else:
+        price = None
+    
+    return symbol, side, order_type, quantity, price
+
+def load_batch_file(path):
+    """
+    Read a list of orders from a JSON file ('-' reads from the keyboard/pipe).
+    
+    Example file:
+      [
+        {"symbol": "BTCUSDT", "side": "BUY", "order_type": "MARKET", "quantity": "0.001"},
+        {"symbol": "ETHUSDT", "side": "SELL", "order_type": "LIMIT", "quantity": "0.1", "price": "2500"}
+      ]
+    """
+    # Numbers like 0.1 are kept as the exact text from the file (parse_float=str),
+    # not turned into floats first
+    try:
+        if path == '-':
+            entries = json.load(sys.stdin, parse_float=str)
+        else:
+            with open(path, encoding='utf-8') as f:
+                entries = json.load(f, parse_float=str)
+    except (OSError, json.JSONDecodeError) as e:
+        raise ValueError(f"Could not read batch file {path}: {str(e)}")
+    
+    if not isinstance(entries, list) or not entries:
+        raise ValueError(f"Batch file {path} must contain a non-empty list of orders")
+    
+    orders = []
+    for number, entry in enumerate(entries, start=1):
+        try:
+            orders.append(validate_order(
+                entry['symbol'],
+                entry['side'],
+                entry['order_type'],
+                str(entry['quantity']),
+                None if entry.get('price') is None else str(entry['price'])
+            ))
+        except KeyError as e:
+            raise ValueError(f"Order #{number} in batch file is missing a field: {str(e)}")
+        except (TypeError, AttributeError):
+            raise ValueError(f"Order #{number} in batch file must be an object with text fields")
+        except ValueError as e:
+            raise ValueError(f"Order #{number} in batch file: {str(e)}")
+    
+    return orders
+
+def _build_parser() -> argparse.ArgumentParser:
+    """
+    Create the command line argument parser.
+    Built once when the program starts (see _PARSER below).
+    """
     # Setup command line argument parser
     parser = argparse.ArgumentParser(
         description='Place orders on Binance Futures Testnet',
@@ -83,6 +212,15 @@ EXAMPLES:
   # Limit order (buy at specific price)
   python cli.py ETHUSDT SELL LIMIT 0.1 --price 2500
   
+  # Many orders at once from a JSON file
+  python cli.py --batch-file orders.json
+  
+  # Same, using worker threads instead of asyncio
+  python cli.py --batch-file orders.json --threaded
+  
+  # Skip the confirmation question
+  python cli.py BTCUSDT BUY MARKET 0.001 --yes
+  
   # Get help
   python cli.py --help
         """
@@ -91,118 +229,311 @@ EXAMPLES:
     # Define command line arguments
     parser.add_argument(
         'symbol',
+        nargs='?',
         help='Trading pair symbol (e.g., BTCUSDT, ETHUSDT)'
     )
     
     parser.add_argument(
         'side',
+        nargs='?',
         help='BUY or SELL'
     )
     
     parser.add_argument(
         'order_type',
+        nargs='?',
         help='MARKET or LIMIT'
     )
     
     parser.add_argument(
         'quantity',
+        nargs='?',
         help='Amount to trade (e.g., 0.001 for BTC)'
     )
     
     parser.add_argument(
         '--price',
-        type=float,
         help='Price for LIMIT orders (required for LIMIT)'
     )
     
+    parser.add_argument(
+        '--batch-file',
+        help="JSON file with a list of orders to place together ('-' reads from stdin)"
+    )
+    
+    parser.add_argument(
+        '--threaded',
+        action='store_true',
+        help='Place batch orders from worker threads instead of asyncio'
+    )
+    
+    parser.add_argument(
+        '-y', '--yes',
+        action='store_true',
+        help="Don't ask for confirmation (also skipped when not run from a terminal)"
+    )
+    
+    return parser
+
+# The parser is the same every time, so build it only once
+_PARSER = _build_parser()
+
+def main(argv=None):
+    """
+    Main function - the starting point of our program.
+    This handles command line arguments, checks the order(s) and hands
+    them to main_async (or main_threaded).
+    
+    Parameters:
+    - argv: List of arguments to use instead of the real command line
+    """
+    print_banner()
+    
     # Parse arguments from command line
-    args = parser.parse_args()
+    args = _PARSER.parse_args(argv)
+    
+    if not args.batch_file and args.quantity is None:
+        _PARSER.error("symbol, side, order_type and quantity are required (or use --batch-file)")
     
     try:
-        logger.info("Starting order placement process...")
+        # Validate first, so a typo never loads asyncio or binance
+        prepared = prepare_orders(args)
+        if isinstance(prepared, int):
+            return prepared
         
-        # STEP 1: Validate all inputs using our Validator class
-        print("\n Validating inputs...")
-        try:
-            symbol = Validator.validate_symbol(args.symbol)
-            side = Validator.validate_side(args.side)
-            order_type = Validator.validate_order_type(args.order_type)
-            quantity = Validator.validate_quantity(args.quantity)
-            
-            # Special check for LIMIT orders
-            if order_type == 'LIMIT':
-                if not args.price:
-                    raise ValueError(" Price is required for LIMIT orders!")
-                price = Validator.validate_price(str(args.price))
-            else:
-                price = None
-                
-            print(" All inputs validated successfully!")
+        if args.threaded:
+            return main_threaded(*prepared, args)
+        import asyncio
+        return asyncio.run(main_async(*prepared, args))
+    
+    except KeyboardInterrupt:
+        # Handle Ctrl+C gracefully
+        print("\n\n  Operation cancelled by user.")
+        return 0
+    
+    except Exception as e:
+        # Catch any other unexpected errors
+        print(f"\n Unexpected error: {str(e)}")
+        logger.error("Unexpected error in main: %s", e)
+        return 1
+
+def prepare_orders(args):
+    """
+    STEP 1-2: Validate the order(s) and read the API credentials.
+    
+    Returns (orders, api_key, api_secret), or an exit code if we should stop.
+    """
+    logger.info("Starting order placement process...")
+    
+    # STEP 1: Validate all inputs using our Validator class
+    print("\n Validating inputs...")
+    try:
+        if args.batch_file:
+            orders = load_batch_file(args.batch_file)
+        else:
+            orders = [validate_order(
+                args.symbol, args.side, args.order_type, args.quantity, args.price
+            )]
             
-        except ValueError as e:
-            # If validation fails, show error and exit
-            logger.error(f"Input validation failed: {str(e)}")
-            print(f"\n Error: {str(e)}")
-            print("\n Tip: Use --help to see examples")
-            return 1
-        
-        # STEP 2: Get API credentials
-        api_key = os.getenv('BINANCE_API_KEY')
-        api_secret = os.getenv('BINANCE_API_SECRET')
+        print(" All inputs validated successfully!")
         
-        if not api_key or not api_secret:
-            print("\n API credentials not found!")
-            print("   Please create a '.env' file with:")
-            print("   BINANCE_API_KEY=your_key_here")
-            print("   BINANCE_API_SECRET=your_secret_here")
-            print("\n   See '.env.example' for an example.")
-            return 1
-        
-        # STEP 3: Show order summary and ask for confirmation
-        if not print_order_summary(symbol, side, order_type, quantity, price):
-            print("\n Order cancelled by user.")
-            return 0
+    except ValueError as e:
+        # If validation fails, show error and exit
+        logger.error("Input validation failed: %s", e)
+        print(f"\n Error: {str(e)}")
+        print("\n Tip: Use --help to see examples")
+        return 1
+    
+    # STEP 2: Get API credentials
+    try:
+        api_key, api_secret = _get_credentials()
+    except RuntimeError:
+        print("\n API credentials not found!")
+        print("   Please create a '.env' file with:")
+        print("   BINANCE_API_KEY=your_key_here")
+        print("   BINANCE_API_SECRET=your_secret_here")
+        print("\n   See '.env.example' for an example.")
+        return 1
+    
+    return orders, api_key, api_secret
+
+def connect(api_key, api_secret):
+    """
+    STEP 3: Set up the Binance client. Returns the client, or None on failure.
+    Nothing is sent yet: "Connected" is printed once the trading rules
+    have been downloaded (see print_connected).
+    """
+    print("\n Connecting to Binance...")
+    try:
+        from bot.client import get_client
+        return get_client(api_key, api_secret)
+    except Exception as e:
+        print(f"\n Failed to connect to Binance: {str(e)}")
+        print("\n Check your API credentials and internet connection")
+        return None
+
+def print_connected():
+    """Tell the user the first request to Binance went through."""
+    print(" Connected to Binance Testnet!")
+
+def apply_symbol_filters(client, orders):
+    """
+    Round each order to Binance's step and tick sizes for its symbol,
+    so it isn't rejected for having too many decimals.
+    
+    Returns the adjusted orders, or None if one of them can't be placed.
+    """
+    adjusted = []
+    
+    try:
+        for symbol, side, order_type, quantity, price in orders:
+            filters = client.get_symbol_filters(symbol)
+            
+            new_quantity = Validator.validate_quantity(quantity, filters['stepSize'])
+            if new_quantity < filters['minQty']:
+                raise ValueError(f"Quantity {quantity} is below the minimum of {filters['minQty']} for {symbol}")
+            if new_quantity != quantity:
+                print(f" Note: {symbol} quantity {quantity} rounded to {new_quantity}")
+            
+            new_price = price
+            if price is not None:
+                new_price = Validator.validate_price(price, filters['tickSize'], side)
+                if new_price != price:
+                    print(f" Note: {symbol} price {price} rounded to {new_price}")
+                Validator.validate_notional(new_quantity, new_price, filters['minNotional'])
+            
+            adjusted.append((symbol, side, order_type, new_quantity, new_price))
         
-        # STEP 4: Connect to Binance
-        print("\n Connecting to Binance...")
+    except ValueError as e:
+        logger.error("Order does not match the symbol's trading rules: %s", e)
+        print(f"\n Error: {str(e)}")
+        return None
+    
+    except Exception as e:
+        logger.error("Could not get trading rules: %s", e)
+        print(f"\n Failed to get trading rules from Binance: {str(e)}")
+        return None
+    
+    return adjusted
+
+def confirm_orders(orders, args):
+    """
+    STEP 4: Show the order summary and ask for confirmation.
+    This runs after the rounding, so the user confirms exactly
+    what will be sent (a batch is confirmed once as a whole).
+    """
+    if args.batch_file:
+        confirmed = print_batch_summary(orders, args.yes)
+    else:
+        confirmed = print_order_summary(*orders[0], assume_yes=args.yes)
+    
+    if not confirmed:
+        print("\n Order cancelled by user.")
+    return confirmed
+
+def print_placing(orders):
+    """STEP 5: Tell the user what is about to be sent."""
+    if len(orders) == 1:
+        print(f"\n Placing {orders[0][2]} order...")
+    else:
+        print(f"\n Placing {len(orders)} orders...")
+
+def report_results(results):
+    """STEP 6: Show results. Returns the exit code."""
+    failed = 0
+    for response in results:
+        if isinstance(response, Exception):
+            failed += 1
+            print(f"\n Failed to place order: {str(response)}")
+            logger.error("Order placement failed: %s", response)
+        else:
+            logger.info("Order %s placed successfully", response.get('orderId'))
+            try:
+                print_order_result(response)
+            except Exception as e:
+                # The order IS placed - a display problem must not hide it
+                # (or the results after it), or it could get placed twice
+                print(f"\n Order placed, but its details could not be shown: {str(e)}")
+                print(f"   Binance replied: {response}")
+                logger.error("Could not show order result %s: %s", response, e)
+    
+    return 1 if failed else 0
+
+async def main_async(orders, api_key, api_secret, args):
+    """
+    Connects to Binance and places the validated order(s).
+    All orders share one open connection and are sent at the same time.
+    """
+    client = connect(api_key, api_secret)
+    if client is None:
+        return 1
+    
+    try:
+        await client.connect_async()
+    except Exception as e:
+        print(f"\n Failed to connect to Binance: {str(e)}")
+        print("\n Check your API credentials and internet connection")
+        return 1
+    
+    try:
+        # Fetch the symbol rules once over the async connection
+        # (the sync one is never opened) and round the orders to them
         try:
-            client = BinanceFuturesClient(api_key, api_secret)
-            print(" Connected to Binance Testnet!")
+            await client.load_symbol_filters_async()
         except Exception as e:
-            print(f"\n Failed to connect to Binance: {str(e)}")
-            print("\n Check your API credentials and internet connection")
+            logger.error("Could not get trading rules: %s", e)
+            print(f"\n Failed to get trading rules from Binance: {str(e)}")
             return 1
+        print_connected()
         
-        # STEP 5: Place the order
-        print(f"\n Placing {order_type} order...")
-        try:
-            if order_type == 'MARKET':
-                response = client.place_market_order(symbol, side, quantity)
-            else:  # LIMIT order
-                response = client.place_limit_order(symbol, side, quantity, price)
-            
-            # STEP 6: Show results
-            print_order_result(response)
-            
-            logger.info(f"Order {response.get('orderId')} placed successfully")
-            return 0
-            
-        except Exception as e:
-            print(f"\n Failed to place order: {str(e)}")
-            logger.error(f"Order placement failed: {str(e)}")
+        orders = apply_symbol_filters(client, orders)
+        if orders is None:
             return 1
+        
+        if not confirm_orders(orders, args):
+            return 0
+        
+        print_placing(orders)
+        results = await client.place_orders_async(
+            [client.build_order(*order) for order in orders]
+        )
+    finally:
+        await client.close_async()
     
-    except KeyboardInterrupt:
-        # Handle Ctrl+C gracefully
-        print("\n\n  Operation cancelled by user.")
-        return 0
+    return report_results(results)
+
+def main_threaded(orders, api_key, api_secret, args):
+    """
+    Same as main_async, but places the orders from worker threads
+    over the shared keep-alive HTTP session.
+    """
+    client = connect(api_key, api_secret)
+    if client is None:
+        return 1
     
+    # Fetch the symbol rules once and round the orders to them
+    try:
+        client.load_symbol_filters()
     except Exception as e:
-        # Catch any other unexpected errors
-        print(f"\n Unexpected error: {str(e)}")
-        logger.error(f"Unexpected error in main: {str(e)}")
+        logger.error("Could not get trading rules: %s", e)
+        print(f"\n Failed to get trading rules from Binance: {str(e)}")
         return 1
+    print_connected()
+    
+    orders = apply_symbol_filters(client, orders)
+    if orders is None:
+        return 1
+    
+    if not confirm_orders(orders, args):
+        return 0
+    
+    print_placing(orders)
+    results = client.place_orders_batch(
+        [client.build_order(*order) for order in orders]
+    )
+    
+    return report_results(results)
 
 # This makes the file executable
 if __name__ == "__main__":
-    sys.exit(main())
\ No newline at end of file
+    sys.exit(main())